@@ -6,14 +6,11 @@ documentation pages for each module type (providers, tools, hooks, orchestrators
 """
 
 import logging
+import os
+import tomllib
 from pathlib import Path
 from typing import Any
 
-try:
-    import tomli
-except ImportError:
-    tomli = None
-
 try:
     import yaml
 except ImportError:
@@ -55,15 +52,28 @@ MODULE_TYPES = {
     },
 }
 
+# All module repositories are named "amplifier-module-<segment>-<name>";
+# map <segment> to its module type so matching is a single dict lookup
+MODULE_PREFIX = "amplifier-module-"
+MODULE_TYPE_BY_SEGMENT = {
+    config["prefix"][len(MODULE_PREFIX):-1]: module_type
+    for module_type, config in MODULE_TYPES.items()
+}
+
+# Page placeholders, built once rather than per page
+PLACEHOLDER_PREFIX = "<!-- MODULE_"
+CATALOG_PLACEHOLDER = "<!-- MODULE_CATALOG -->"
+MODULE_LIST_PLACEHOLDERS = {
+    module_type: f"<!-- MODULE_LIST_{module_type.upper()} -->"
+    for module_type in MODULE_TYPES
+}
+
 
 def get_module_info(module_path: Path) -> dict[str, Any] | None:
     """Extract module information from pyproject.toml and README."""
     pyproject_path = module_path / "pyproject.toml"
     readme_path = module_path / "README.md"
 
-    if not pyproject_path.exists():
-        return None
-
     info = {
         "name": module_path.name,
         "path": str(module_path),
@@ -73,29 +83,32 @@ def get_module_info(module_path: Path) -> dict[str, Any] | None:
         "readme_content": "",
     }
 
-    # Parse pyproject.toml
-    if tomli:
-        try:
-            with open(pyproject_path, "rb") as f:
-                data = tomli.load(f)
-                project = data.get("project", {})
-                info["description"] = project.get("description", "")
-                info["version"] = project.get("version", "")
-
-                # Get entry point
-                entry_points = project.get("entry-points", {})
-                amplifier_modules = entry_points.get("amplifier.modules", {})
-                if amplifier_modules:
-                    info["entry_point"] = list(amplifier_modules.keys())[0]
-        except Exception as e:
-            log.warning(f"Failed to parse {pyproject_path}: {e}")
+    # Parse pyproject.toml, opening it directly rather than exists() + open();
+    # a missing file means this directory is not a module
+    try:
+        with open(pyproject_path, "rb") as f:
+            data = tomllib.load(f)
+        project = data.get("project", {})
+        info["description"] = project.get("description", "")
+        info["version"] = project.get("version", "")
+
+        # Get entry point
+        entry_points = project.get("entry-points", {})
+        amplifier_modules = entry_points.get("amplifier.modules", {})
+        if amplifier_modules:
+            info["entry_point"] = list(amplifier_modules.keys())[0]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning(f"Failed to parse {pyproject_path}: {e}")
 
     # Read README
-    if readme_path.exists():
-        try:
-            info["readme_content"] = readme_path.read_text()
-        except Exception as e:
-            log.warning(f"Failed to read {readme_path}: {e}")
+    try:
+        info["readme_content"] = readme_path.read_text()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log.warning(f"Failed to read {readme_path}: {e}")
 
     return info
 
@@ -106,18 +119,24 @@ def discover_modules(base_path: Path) -> dict[str, list[dict[str, Any]]]:
         key: [] for key in MODULE_TYPES
     }
 
-    for module_type, config in MODULE_TYPES.items():
-        prefix = config["prefix"]
-        for path in base_path.iterdir():
-            if path.is_dir() and path.name.startswith(prefix):
-                info = get_module_info(path)
-                if info:
-                    # Extract the module name without prefix
-                    info["short_name"] = path.name[len(prefix):]
-                    modules_by_type[module_type].append(info)
+    # Single scandir pass; DirEntry.is_dir() uses the cached d_type
+    with os.scandir(base_path) as entries:
+        for entry in entries:
+            if not entry.name.startswith(MODULE_PREFIX):
+                continue
+            segment, sep, short_name = entry.name[len(MODULE_PREFIX):].partition("-")
+            module_type = MODULE_TYPE_BY_SEGMENT.get(segment)
+            if not sep or module_type is None or not entry.is_dir():
+                continue
+            info = get_module_info(Path(entry.path))
+            if info:
+                # Module name without prefix
+                info["short_name"] = short_name
+                modules_by_type[module_type].append(info)
 
-        # Sort by name
-        modules_by_type[module_type].sort(key=lambda x: x["short_name"])
+    # Sort by name
+    for module_list in modules_by_type.values():
+        module_list.sort(key=lambda x: x["short_name"])
 
     return modules_by_type
 
@@ -192,21 +211,20 @@ def on_config(config: dict[str, Any]) -> dict[str, Any]:
     docs_dir = Path(config.get("docs_dir", "docs"))
     base_path = docs_dir.parent.parent  # Go from amplifier-docs/docs to potential parent
 
-    # Check if we're in a context with module directories
-    has_modules = any(
-        p.is_dir() and p.name.startswith("amplifier-module-")
-        for p in base_path.iterdir()
-    ) if base_path.exists() else False
+    # Discover in a single pass; an empty result means standalone mode
+    try:
+        modules = discover_modules(base_path)
+    except FileNotFoundError:
+        modules = {key: [] for key in MODULE_TYPES}
+    has_modules = any(modules.values())
 
     if has_modules:
-        modules = discover_modules(base_path)
         # Log discovered modules
         for module_type, module_list in modules.items():
             if module_list:
                 log.info(f"  Found {len(module_list)} {MODULE_TYPES[module_type]['display_name'].lower()}")
     else:
         log.info("  No local modules found (standalone mode)")
-        modules = {key: [] for key in MODULE_TYPES}
 
     # Store modules in config for later use
     config["amplifier_modules"] = modules
@@ -225,17 +243,20 @@ def on_page_markdown(
     markdown: str, page: Any, config: dict[str, Any], files: Any
 ) -> str:
     """MkDocs hook called for each page's markdown content."""
+    # Most pages have no placeholders; skip them with one substring scan
+    if PLACEHOLDER_PREFIX not in markdown:
+        return markdown
+
     # Replace placeholder markers with dynamic content
     modules = config.get("amplifier_modules", {})
 
     # Replace module catalog placeholder
-    if "<!-- MODULE_CATALOG -->" in markdown:
+    if CATALOG_PLACEHOLDER in markdown:
         catalog = generate_module_catalog(modules)
-        markdown = markdown.replace("<!-- MODULE_CATALOG -->", catalog)
+        markdown = markdown.replace(CATALOG_PLACEHOLDER, catalog)
 
     # Replace specific module type placeholders
-    for module_type, config_data in MODULE_TYPES.items():
-        placeholder = f"<!-- MODULE_LIST_{module_type.upper()} -->"
+    for module_type, placeholder in MODULE_LIST_PLACEHOLDERS.items():
         if placeholder in markdown:
             module_list = generate_module_list(modules.get(module_type, []), module_type)
             markdown = markdown.replace(placeholder, module_list)
@@ -245,27 +266,27 @@ def on_page_markdown(
 
 def generate_module_catalog(modules: dict[str, list[dict[str, Any]]]) -> str:
     """Generate a full module catalog."""
-    content = ""
+    parts: list[str] = []
 
     for module_type, module_list in modules.items():
         if not module_list:
             continue
 
         config = MODULE_TYPES[module_type]
-        content += f"\n### {config['display_name']}\n\n"
-        content += f"{config['description']}\n\n"
-        content += "| Module | Description |\n"
-        content += "|--------|-------------|\n"
+        parts.append(f"\n### {config['display_name']}\n\n")
+        parts.append(f"{config['description']}\n\n")
+        parts.append("| Module | Description |\n")
+        parts.append("|--------|-------------|\n")
 
         for module in module_list:
             name = module["short_name"]
             desc = module["description"][:80] + "..." if len(module["description"]) > 80 else module["description"]
             link = f"[{name}]({config['docs_path']}/{name.replace('-', '_')}.md)"
-            content += f"| {link} | {desc} |\n"
+            parts.append(f"| {link} | {desc} |\n")
 
-        content += "\n"
+        parts.append("\n")
 
-    return content
+    return "".join(parts)
 
 
 def generate_module_list(modules: list[dict[str, Any]], module_type: str) -> str:
@@ -273,13 +294,13 @@ def generate_module_list(modules: list[dict[str, Any]], module_type: str) -> str
     if not modules:
         return "*No modules found.*"
 
-    content = ""
+    parts: list[str] = []
     for module in modules:
         name = module["short_name"]
         desc = module["description"]
         entry_point = module["entry_point"]
 
-        content += f"""
+        parts.append(f"""
 <div class="module-card">
 <div class="content">
 <h4><a href="{name.replace('-', '_')}/">{name.replace("-", " ").title()}</a></h4>
@@ -287,6 +308,6 @@ def generate_module_list(modules: list[dict[str, Any]], module_type: str) -> str
 <code>{entry_point}</code>
 </div>
 </div>
-"""
+""")
 
-    return content
+    return "".join(parts)